@@ -26,6 +26,7 @@ import zstandard as zstd
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
 
+from smartdrive.commune.utils import STREAM_CHUNK_SIZE_BYTES
 from smartdrive.utils import DEFAULT_CLIENT_PATH
 
 
@@ -35,7 +36,7 @@ def encrypt_with_aes(data_stream, aes_key, output_stream):
     output_stream.write(iv)
 
     while True:
-        chunk = data_stream.read(16384)
+        chunk = data_stream.read(STREAM_CHUNK_SIZE_BYTES)
         if not chunk:
             break
         encrypted_chunk = cipher.encrypt(chunk)
@@ -67,7 +68,7 @@ def decrypt_with_aes(input_stream, aes_key, output_stream):
     cipher = AES.new(aes_key, AES.MODE_CFB, iv)
 
     while True:
-        chunk = input_stream.read(16384)
+        chunk = input_stream.read(STREAM_CHUNK_SIZE_BYTES)
         if not chunk:
             break
         decrypted_chunk = cipher.decrypt(chunk)
@@ -26,3 +26,7 @@ class CommuneNetworkUnreachable(Exception):
 
 class TimeoutException(Exception):
     pass
+
+
+class ModuleCallException(Exception):
+    pass
@@ -26,6 +26,8 @@ from communex.types import Ss58Address
 
 
 class ConnectionInfo:
+    __slots__ = ("ip", "port")
+
     def __init__(self, ip: str, port: int):
         self.ip = ip
         self.port = port
@@ -35,6 +37,8 @@ class ConnectionInfo:
 
 
 class ModuleInfo:
+    __slots__ = ("uid", "ss58_address", "connection", "incentives", "dividends", "stake")
+
     def __init__(self, uid: str, ss58_address: Ss58Address, connection: Optional[ConnectionInfo] = None, incentives: Optional[int] = None, dividends: Optional[int] = None, stake: Optional[int] = None):
         self.uid = uid
         self.ss58_address = ss58_address
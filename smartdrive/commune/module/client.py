@@ -23,6 +23,7 @@
 import asyncio
 import json
 import os
+import weakref
 
 import aiofiles
 import aiohttp
@@ -32,10 +33,49 @@ from urllib3.exceptions import InsecureRequestWarning
 from substrateinterface import Keypair
 
 from ._protocol import create_method_endpoint, create_request_data
-from ..utils import calculate_hash
+from ..errors import ModuleCallException
+from ..utils import calculate_hash, STREAM_CHUNK_SIZE_BYTES
 
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
+MAX_CONNECTIONS = 128
+# Below the 5 seconds uvicorn keeps idle connections, so a request is never sent on a connection the server is closing
+KEEPALIVE_TIMEOUT_SECONDS = 4
+
+# A ClientSession is bound to the event loop that created it, so one pooled session is kept per running loop.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def _get_session() -> ClientSession:
+    """
+    Return the shared session of the running event loop, creating it if needed.
+
+    Reusing the session keeps the TCP and TLS connections to the modules alive between calls, instead of
+    paying a new handshake on every request. Modules are served by uvicorn, which only speaks HTTP/1.1, so
+    concurrent calls to the same module use separate pooled connections rather than HTTP/2 streams.
+
+    Returns:
+        ClientSession: The session bound to the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS, ssl=False)
+        session = ClientSession(connector=connector)
+        _sessions[loop] = session
+    return session
+
+
+async def close_session():
+    """
+    Close the shared session of the running event loop, if any.
+
+    Should be awaited before a short-lived event loop finishes, e.g. the ones created by `asyncio.run`.
+    """
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session and not session.closed:
+        await session.close()
+
 
 class ModuleClient:
     host: str
@@ -56,17 +96,17 @@ class ModuleClient:
         async def _store_streaming_response(response: ClientResponse, chunk_path: str) -> str:
             try:
                 async with aiofiles.open(chunk_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(16384):
+                    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE_BYTES):
                         await f.write(chunk)
 
                 return chunk_path
-            except Exception as e:
-                raise Exception(f"Failed to store streaming response: {e}")
+            except OSError as e:
+                raise ModuleCallException(f"Failed to store streaming response: {e}") from e
 
         async def _get_body(response: ClientResponse, chunk_index: str = "", user_path: str = ""):
             response.raise_for_status()
             if response.status != 200:
-                raise Exception(f"Unexpected status code: {response.status}, response: {await response.text()}")
+                raise ModuleCallException(f"Unexpected status code: {response.status}, response: {await response.text()}")
 
             content_type = response.headers.get('Content-Type')
             if content_type == 'application/json':
@@ -75,38 +115,39 @@ class ModuleClient:
                 chunk_path = os.path.join(user_path, f"chunk_{chunk_index}.part")
                 return await _store_streaming_response(response, chunk_path)
             else:
-                raise Exception(f"Unknown content type: {content_type}")
+                raise ModuleCallException(f"Unknown content type: {content_type}")
         try:
-            async with ClientSession(timeout=aiohttp.ClientTimeout(connect=5, sock_connect=5, total=timeout)) as session:
-                if file:
-                    file_size = os.path.getsize(file["chunk"])
-                    file_hash = await calculate_hash(file["chunk"])
-                    _, headers = create_request_data(self.key, target_key, {"file_hash": file_hash, "file_size_bytes": file_size}, content_type="application/octet-stream")
-                    headers["X-File-Size"] = str(file_size)
-                    headers["X-File-Hash"] = file_hash
-                    headers["Folder"] = file['folder']
-                    headers["Target-Key"] = target_key
-
-                    async with aiofiles.open(file["chunk"], 'rb') as f:
-                        multipartWriter = aiohttp.MultipartWriter("form-data")
-                        part = multipartWriter.append(f)
-                        part.set_content_disposition('form-data', name='chunk', filename='file')
-                        headers["Content-Type"] = f"multipart/form-data; boundary={multipartWriter.boundary}"
-                        async with session.post(url, data=multipartWriter, headers=headers, ssl=False) as response:
-                            return await _get_body(response)
+            session = _get_session()
+            client_timeout = aiohttp.ClientTimeout(connect=5, sock_connect=5, total=timeout)
+            if file:
+                file_size = os.path.getsize(file["chunk"])
+                file_hash = await calculate_hash(file["chunk"])
+                _, headers = create_request_data(self.key, target_key, {"file_hash": file_hash, "file_size_bytes": file_size}, content_type="application/octet-stream")
+                headers["X-File-Size"] = str(file_size)
+                headers["X-File-Hash"] = file_hash
+                headers["Folder"] = file['folder']
+                headers["Target-Key"] = target_key
+
+                async with aiofiles.open(file["chunk"], 'rb') as f:
+                    multipartWriter = aiohttp.MultipartWriter("form-data")
+                    part = multipartWriter.append(f)
+                    part.set_content_disposition('form-data', name='chunk', filename='file')
+                    headers["Content-Type"] = f"multipart/form-data; boundary={multipartWriter.boundary}"
+                    async with session.post(url, data=multipartWriter, headers=headers, ssl=False, timeout=client_timeout) as response:
+                        return await _get_body(response)
+            else:
+                chunk_index = params.pop("chunk_index", "")
+                user_path = params.pop("user_path", "")
+                serialized_data, headers = create_request_data(self.key, target_key, params)
+                if fn == "remove":
+                    async with session.delete(url, json=json.loads(serialized_data), headers=headers, ssl=False, timeout=client_timeout) as response:
+                        return await _get_body(response)
                 else:
-                    chunk_index = params.pop("chunk_index", "")
-                    user_path = params.pop("user_path", "")
-                    serialized_data, headers = create_request_data(self.key, target_key, params)
-                    if fn == "remove":
-                        async with session.delete(url, json=json.loads(serialized_data), headers=headers, ssl=False) as response:
-                            return await _get_body(response)
-                    else:
-                        async with session.post(url, json=json.loads(serialized_data), headers=headers, ssl=False) as response:
-                            return await _get_body(response, chunk_index, user_path)
+                    async with session.post(url, json=json.loads(serialized_data), headers=headers, ssl=False, timeout=client_timeout) as response:
+                        return await _get_body(response, chunk_index, user_path)
         except asyncio.TimeoutError as e:
-            raise Exception(f"The call took longer than the timeout of {timeout} second(s)").with_traceback(e.__traceback__)
-        except aiohttp.ClientError as e:
-            raise Exception(f"An error occurred: {e}").with_traceback(e.__traceback__)
+            raise ModuleCallException(f"The call took longer than the timeout of {timeout} second(s)") from e
         except aiohttp.ClientSSLError as e:
-            raise Exception(f"SSL error occurred: {e}").with_traceback(e.__traceback__)
+            raise ModuleCallException(f"SSL error occurred: {e}") from e
+        except aiohttp.ClientError as e:
+            raise ModuleCallException(f"An error occurred: {e}") from e
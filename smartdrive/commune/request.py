@@ -21,8 +21,11 @@
 #  SOFTWARE.
 
 import asyncio
+import random
+import time
+import weakref
 from functools import wraps
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 from communex._common import get_node_url, transform_stake_dmap
 from communex.client import CommuneClient
@@ -33,7 +36,7 @@ from substrateinterface import Keypair
 from communex.types import Ss58Address
 
 from smartdrive import logger
-from smartdrive.commune.errors import CommuneNetworkUnreachable, TimeoutException
+from smartdrive.commune.errors import CommuneNetworkUnreachable, TimeoutException, ModuleCallException
 from smartdrive.commune.models import ConnectionInfo, ModuleInfo
 from smartdrive.commune.module.client import ModuleClient
 from smartdrive.commune.utils import _get_ip_port
@@ -44,6 +47,16 @@ EXTENDED_PING_TIMEOUT = 60
 CALL_TIMEOUT = 10
 RETRIES = 5
 TIMEOUT = 30
+MINER_REQUEST_BACKOFF_SECONDS = 0.5
+MAX_SIMULTANEOUS_MINER_REQUESTS = 64  # Should always be less than the connections limit of the module client
+MODULES_CACHE_TTL_SECONDS = 20
+MODULES_REFRESH_INTERVAL_SECONDS = 15  # Should always be less than MODULES_CACHE_TTL_SECONDS
+
+# Modules registered in the subnet, keyed by (netuid, testnet) and stored with the monotonic time they were fetched.
+_modules_cache: Dict[Tuple[int, bool], Tuple[float, List[ModuleInfo]]] = {}
+
+# An asyncio.Semaphore is bound to the event loop where it is first awaited, so one is kept per running loop.
+_miner_requests_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
 
 
 async def get_filtered_modules(netuid: int, module_type: ModuleType, testnet: bool, ss58_address: str = None, without_address: bool = False) -> List[ModuleInfo]:
@@ -99,17 +112,16 @@ async def get_active_validators(key: Keypair, netuid: int, testnet: bool, timeou
     Raises:
         CommuneNetworkUnreachable: Raised if a valid result cannot be obtained from the network.
     """
-    validators = await get_filtered_modules(netuid, ModuleType.VALIDATOR, testnet)
-
-    async def _get_active_validators(validator):
-        ping_response = await execute_miner_request(key, validator.connection, validator.ss58_address, "ping", timeout=timeout)
-        if ping_response and ping_response["type"] == "validator":
-            return validator
-        return None
-
-    futures = [_get_active_validators(validator) for validator in validators if validator.ss58_address != key.ss58_address]
-    results = await asyncio.gather(*futures, return_exceptions=True)
-    active_validators = [result for result in results if isinstance(result, ModuleInfo)]
+    validators = [validator for validator in await get_filtered_modules(netuid, ModuleType.VALIDATOR, testnet) if validator.ss58_address != key.ss58_address]
+
+    responses = await asyncio.gather(
+        *[execute_miner_request(key, validator.connection, validator.ss58_address, "ping", timeout=timeout) for validator in validators],
+        return_exceptions=True
+    )
+    active_validators = [
+        validator for validator, response in zip(validators, responses)
+        if isinstance(response, dict) and response.get("type") == "validator"
+    ]
     return active_validators
 
 
@@ -120,13 +132,19 @@ async def execute_miner_request(
         action: str,
         params: Dict[str, Any] = None,
         file: Any = None,
-        timeout: int = CALL_TIMEOUT
+        timeout: int = CALL_TIMEOUT,
+        retries: int = 0
 ):
     """
     Executes a request to a miner and returns the response.
 
     This method sends a request to a miner using the specified action and parameters.
     It handles exceptions that may occur during the request and returns the miner's response.
+    At most MAX_SIMULTANEOUS_MINER_REQUESTS requests are in flight at the same time, and the timeout
+    only starts once the request is sent, so waiting for a free slot never counts against it.
+
+    Failed requests can be retried with an exponential backoff with jitter. Retries should only be
+    used for idempotent actions, e.g. a store retried after a timeout could store the chunk twice.
 
     Params:
         validator_key (Keypair): The validator Keypair.
@@ -135,22 +153,39 @@ async def execute_miner_request(
         action (str): The action to be performed by the miner.
         params (Dict[str, Any], optional): Additional parameters for the action. Defaults to an empty dictionary.
         files (Any): Additional parameters for the action. Defaults to None.
-        timeout (int, optional): Timeout for the call.
+        timeout (int, optional): Timeout for each attempt of the call.
+        retries (int, optional): Number of retries after a failed attempt. Defaults to 0.
 
-    Raises:
-        Exception: If an unexpected error occurs during the request.
+    Returns:
+        The miner's answer, or None if the miner could not be reached or answered with an error.
     """
     if params is None:
         params = {}
 
-    try:
-        client = ModuleClient(connection.ip, int(connection.port), validator_key)
-        miner_answer = await client.call(fn=action, target_key=miner_key, params=params, file=file, timeout=timeout)
+    for attempt in range(retries + 1):
+        try:
+            client = ModuleClient(connection.ip, int(connection.port), validator_key)
+            async with _get_miner_requests_semaphore():
+                # The client consumes some of the params, so each attempt gets its own copy
+                return await client.call(fn=action, target_key=miner_key, params=dict(params), file=file, timeout=timeout)
 
-    except Exception:
-        miner_answer = None
+        except (ModuleCallException, asyncio.TimeoutError, OSError, ValueError) as e:
+            logger.debug("Request %s to %s failed (attempt %d/%d): %s", action, miner_key, attempt + 1, retries + 1, e)
+
+        if attempt < retries:
+            backoff = MINER_REQUEST_BACKOFF_SECONDS * 2 ** attempt
+            await asyncio.sleep(backoff + random.uniform(0, backoff))
 
-    return miner_answer
+    return None
+
+
+def _get_miner_requests_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _miner_requests_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_SIMULTANEOUS_MINER_REQUESTS)
+        _miner_requests_semaphores[loop] = semaphore
+    return semaphore
 
 
 @retry(RETRIES, [Exception])
@@ -208,9 +243,11 @@ async def _vote_with_timeout(client, key, uids, weights, netuid, testnet, timeou
 
 
 async def vote(key: Keypair, uids: List[int], weights: List[int], netuid: int, testnet: bool, timeout=TIMEOUT):
-    logger.info(f"Voting uids: {uids} - weights: {weights}")
+    logger.info("Voting uids: %s - weights: %s", uids, weights)
     try:
         await _vote_with_timeout(key=key, uids=uids, weights=weights, netuid=netuid, testnet=testnet, timeout=timeout)
+        # The weights change the incentives and dividends of the subnet, so the cached modules are stale
+        invalidate_modules_cache(netuid)
     except Exception:
         logger.error("Error voting", exc_info=True)
 
@@ -224,7 +261,70 @@ async def _get_modules_with_timeout(client, request_dict, testnet, timeout=TIMEO
         raise TimeoutException("Operation timed out")
 
 
+def invalidate_modules_cache(netuid: Optional[int] = None):
+    """
+    Discard the cached modules so the next `get_modules` call queries the chain again.
+
+    Params:
+        netuid (Optional[int]): Network identifier to invalidate. If None, the whole cache is discarded.
+    """
+    if netuid is None:
+        _modules_cache.clear()
+        return
+
+    for cache_key in [cache_key for cache_key in _modules_cache if cache_key[0] == netuid]:
+        _modules_cache.pop(cache_key, None)
+
+
 async def get_modules(netuid: int, testnet: bool, timeout=TIMEOUT) -> List[ModuleInfo]:
+    """
+    Retrieve the modules registered in the subnet.
+
+    The chain query is expensive and its result rarely changes between calls, so the modules are cached for
+    MODULES_CACHE_TTL_SECONDS.
+
+    Params:
+        netuid (int): Network identifier used for the queries.
+        testnet (bool): Flag indicating if environment is testnet or not.
+        timeout (int): Timeout for the chain query.
+
+    Returns:
+        List[ModuleInfo]: A list of `ModuleInfo` objects.
+
+    Raises:
+        CommuneNetworkUnreachable: Raised if a valid result cannot be obtained from the network.
+    """
+    cache_key = (netuid, testnet)
+    cached = _modules_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < MODULES_CACHE_TTL_SECONDS:
+        return list(cached[1])
+
+    modules = await _get_modules(netuid, testnet, timeout)
+    _modules_cache[cache_key] = (time.monotonic(), modules)
+    return list(modules)
+
+
+async def periodic_modules_refresh(netuid: int, testnet: bool):
+    """
+    Periodically refresh the cached modules of the subnet.
+
+    The cache is refreshed before it expires, so the callers of `get_modules` read it instead of waiting for the
+    chain query.
+
+    Params:
+        netuid (int): Network identifier used for the queries.
+        testnet (bool): Flag indicating if environment is testnet or not.
+    """
+    while True:
+        try:
+            modules = await _get_modules(netuid, testnet)
+            _modules_cache[(netuid, testnet)] = (time.monotonic(), modules)
+        except CommuneNetworkUnreachable:
+            logger.debug("Can not refresh the modules, they will be fetched on demand")
+        await asyncio.sleep(MODULES_REFRESH_INTERVAL_SECONDS)
+
+
+async def _get_modules(netuid: int, testnet: bool, timeout=TIMEOUT) -> List[ModuleInfo]:
     request_dict: dict[Any, Any] = {
         "SubspaceModule": [
             ("Keys", [netuid]),
@@ -238,32 +338,27 @@ async def get_modules(netuid: int, testnet: bool, timeout=TIMEOUT) -> List[Modul
         result = await _get_modules_with_timeout(request_dict=request_dict, testnet=testnet, timeout=timeout)
         if result is not None:
 
-            modules_info = []
-
             uid_to_key = result.get("Keys", {})
             if uid_to_key:
 
                 ss58_to_stakefrom = result.get("StakeFrom", {})
                 ss58_to_stakefrom = transform_stake_dmap(ss58_to_stakefrom)
                 uid_to_address = result["Address"]
-                uid_to_incentive = result["Incentive"]
-                uid_to_dividend = result["Dividends"]
-
-                for uid, key in uid_to_key.items():
-                    key = check_ss58_address(key)
-                    address = uid_to_address[uid]
-                    incentive = uid_to_incentive[netuid][uid]
-                    dividend = uid_to_dividend[netuid][uid]
-                    stake_from = ss58_to_stakefrom.get(key, [])
-                    stake = sum(stake for _, stake in stake_from)
-                    connection = None
-
-                    if address:
-                        connection = _get_ip_port(address)
-
-                    modules_info.append(ModuleInfo(uid, key, connection, incentive, dividend, stake))
-
-                return modules_info
+                # Incentives and dividends are stored per netuid, so the subnet values are resolved once.
+                uid_to_incentive = result["Incentive"][netuid]
+                uid_to_dividend = result["Dividends"][netuid]
+
+                # Every map is read in a single pass into parallel columns, which are then walked together
+                # instead of probing four dicts per module.
+                uids = list(uid_to_key)
+                keys = [check_ss58_address(uid_to_key[uid]) for uid in uids]
+                addresses = [uid_to_address[uid] for uid in uids]
+                connections = [_get_ip_port(address) if address else None for address in addresses]
+                incentives = [uid_to_incentive[uid] for uid in uids]
+                dividends = [uid_to_dividend[uid] for uid in uids]
+                stakes = [sum(stake for _, stake in ss58_to_stakefrom.get(key, ())) for key in keys]
+
+                return list(map(ModuleInfo, uids, keys, connections, incentives, dividends, stakes))
 
     except Exception:
         logger.error("Error getting modules", exc_info=True)
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import hashlib
 import re
 from typing import List, Optional
@@ -11,6 +12,10 @@ from smartdrive.logging_config import logger
 from smartdrive.commune.models import ModuleInfo, ConnectionInfo
 from smartdrive.validator.constants import TRUTHFUL_STAKE_AMOUNT
 
+IP_PORT_REGEX = re.compile(r"(\d{1,3}(?:\.\d{1,3}){3}):(\d+)")
+SS58_ADDRESS_CACHE_SIZE = 4096  # Public keys
+STREAM_CHUNK_SIZE_BYTES = 1024 * 1024  # 1 MB
+
 
 def filter_truthful_validators(active_validators: List[ModuleInfo]) -> List[ModuleInfo]:
     return list(filter(lambda validator: validator.stake > TRUTHFUL_STAKE_AMOUNT, active_validators))
@@ -20,9 +25,10 @@ def _extract_address(string: str) -> Optional[List[str]]:
     """
     Extract an IP address and port from a given string.
 
-    This function uses a regular expression to search for an IP address and port combination
-    within the provided string. If a match is found, the IP address and port are returned
-    as a list of strings. If no match is found, None is returned.
+    Addresses are usually well-formed `ip:port` strings, so they are validated directly. Otherwise,
+    a regular expression is used to search for an IP address and port combination within the
+    provided string. If a match is found, the IP address and port are returned as a list of
+    strings. If no match is found, None is returned.
 
     Params:
         string (str): The input string containing the IP address and port.
@@ -31,14 +37,46 @@ def _extract_address(string: str) -> Optional[List[str]]:
         Optional[List[str]]: A list containing the IP address and port as strings if a match
                              is found, or None if no match is found.
     """
-    ip_regex = re.compile(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+")
-    match = re.search(ip_regex, string)
+    parsed_address = _parse_ip_port(string)
+    if parsed_address:
+        return parsed_address
+
+    match = IP_PORT_REGEX.search(string)
     if match:
-        return match.group(0).split(":")
+        return [match.group(1), match.group(2)]
 
     return None
 
 
+def _parse_ip_port(string: str) -> Optional[List[str]]:
+    """
+    Parse a well-formed `ip:port` string without going through the regular expression engine.
+
+    The string must be exactly four runs of 1 to 3 ASCII digits separated by dots, followed by a colon and the port
+    digits, which is the same shape `IP_PORT_REGEX` accepts.
+
+    Params:
+        string (str): The input string containing the IP address and port.
+
+    Returns:
+        Optional[List[str]]: A list containing the IP address and port as strings if the string is well-formed,
+                             or None otherwise.
+    """
+    host, _, port = string.rpartition(":")
+    if not port.isascii() or not port.isdigit():
+        return None
+
+    octets = host.split(".")
+    if len(octets) != 4:
+        return None
+
+    for octet in octets:
+        if not 0 < len(octet) < 4 or not octet.isascii() or not octet.isdigit():
+            return None
+
+    return [host, port]
+
+
 def _get_ip_port(address_string: str) -> Optional[ConnectionInfo]:
     """
     Extract the IP address and port from a given address string and return them as a `ConnectionInfo` object.
@@ -65,10 +103,13 @@ def _get_ip_port(address_string: str) -> Optional[ConnectionInfo]:
         return None
 
 
+@functools.lru_cache(maxsize=SS58_ADDRESS_CACHE_SIZE)
 def get_ss58_address_from_public_key(public_key_hex) -> Optional[Ss58Address]:
     """
     Convert a public key in hexadecimal format to an Ss58Address if valid.
 
+    The same users and validators sign every request, so the conversion is cached by public key.
+
     Params:
         public_key_hex (str): The public key in hexadecimal format.
 
@@ -109,7 +150,7 @@ async def calculate_hash(path: str) -> str:
 
     async with aiofiles.open(path, 'rb') as f:
         while True:
-            chunk = await f.read(16384)
+            chunk = await f.read(STREAM_CHUNK_SIZE_BYTES)
             if not chunk:
                 break
             sha256.update(chunk)
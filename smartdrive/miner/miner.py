@@ -22,8 +22,6 @@
 
 import asyncio
 import hashlib
-import time
-import uuid
 import shutil
 import argparse
 import os
@@ -41,10 +39,11 @@ import smartdrive
 from smartdrive.check_file import check_file
 from smartdrive.logging_config import logger
 from smartdrive.commune.request import get_modules
+from smartdrive.commune.utils import STREAM_CHUNK_SIZE_BYTES
 from smartdrive.miner.config import config_manager, Config
 from smartdrive.miner.middleware.miner_middleware import MinerMiddleware
 from smartdrive.miner.utils import has_enough_space, get_directory_size, parse_body
-from smartdrive.utils import DEFAULT_MINER_PATH, periodic_version_check
+from smartdrive.utils import DEFAULT_MINER_PATH, periodic_version_check, generate_uuid
 
 
 def get_config() -> Config:
@@ -168,7 +167,7 @@ class Miner(Module):
 
             sha256 = hashlib.sha256()
             total_size = 0
-            file_uuid = f"{int(time.time())}_{str(uuid.uuid4())}"
+            file_uuid = generate_uuid()
             chunk_path = os.path.join(client_dir, file_uuid)
             form = await request.form()
             chunk = form.get("chunk")
@@ -238,16 +237,18 @@ class Miner(Module):
             body = parse_body(body_bytes)
 
             chunk_path = os.path.join(config_manager.config.data_path, body["folder"], body["chunk_uuid"])
+            # The chunk is only opened once the response starts streaming, so its existence is checked here
+            chunk_size = os.path.getsize(chunk_path)
 
-            def iterfile():
-                with open(chunk_path, 'rb') as chunk_file:
+            async def iterfile():
+                async with aiofiles.open(chunk_path, 'rb') as chunk_file:
                     while True:
-                        data = chunk_file.read(16384)
+                        data = await chunk_file.read(STREAM_CHUNK_SIZE_BYTES)
                         if not data:
                             break
                         yield data
 
-            return StreamingResponse(iterfile(), media_type='application/octet-stream')
+            return StreamingResponse(iterfile(), media_type='application/octet-stream', headers={"Content-Length": str(chunk_size)})
         except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Chunk not found")
         except Exception as e:
@@ -20,11 +20,14 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import functools
 import json
 from typing import Union
 
 from substrateinterface import Keypair
 
+VERIFICATION_KEYPAIRS_CACHE_SIZE = 1024  # Keypairs
+
 
 def sign_data(data: dict, keypair: Keypair) -> bytes:
     """
@@ -62,9 +65,26 @@ def verify_data_signature(data: Union[dict, bytes], signature_hex: str, ss58_add
     Returns:
         bool: True if the signature is valid, otherwise False.
     """
-    keypair = Keypair(ss58_address=ss58_address)
+    keypair = _get_verification_keypair(ss58_address)
     message = data if isinstance(data, bytes) else json.dumps(data).encode('utf-8')
     signature = bytes.fromhex(signature_hex)
     is_valid = keypair.verify(message, signature)
 
     return is_valid
+
+
+@functools.lru_cache(maxsize=VERIFICATION_KEYPAIRS_CACHE_SIZE)
+def _get_verification_keypair(ss58_address: str) -> Keypair:
+    """
+    Build the public keypair used to verify the signatures of an SS58 address.
+
+    The same peers and users sign every message and request, so the keypair is cached instead of decoding the
+    address again for each verification. It only holds the public key, so it is safe to share.
+
+    Params:
+        ss58_address (str): The SS58 address associated with the public key.
+
+    Returns:
+        Keypair: The keypair with the public key of the SS58 address.
+    """
+    return Keypair(ss58_address=ss58_address)
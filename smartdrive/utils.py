@@ -22,6 +22,8 @@
 
 import asyncio
 import random
+import time
+import uuid
 
 from substrateinterface import Keypair
 
@@ -29,6 +31,7 @@ import smartdrive
 from smartdrive import logger
 from smartdrive.cli.errors import NoValidatorsAvailableException
 from smartdrive.commune.errors import CommuneNetworkUnreachable
+from smartdrive.commune.module.client import close_session
 from smartdrive.commune.request import get_active_validators, EXTENDED_PING_TIMEOUT
 
 INITIAL_STORAGE = 50 * 1024 * 1024  # 50 MB
@@ -61,6 +64,16 @@ def format_size(size_in_bytes: int) -> str:
         return f"{size_in_mb:.2f} MB"
 
 
+def generate_uuid() -> str:
+    """
+    Generate a unique identifier prefixed with the current timestamp in seconds.
+
+    Returns:
+        str: The identifier, e.g. `1718000000_0f8fad5bd9cb469fa16570867728950e`.
+    """
+    return f"{int(time.time())}_{uuid.uuid4().hex}"
+
+
 async def periodic_version_check():
     while True:
         logger.info("Checking for updates...")
@@ -86,6 +99,9 @@ async def _get_validator_url_async(key: Keypair, testnet: bool = False) -> str:
         valid_validators = [validator for validator in validators if validator.connection is not None]
     except CommuneNetworkUnreachable:
         raise NoValidatorsAvailableException
+    finally:
+        # The client runs this lookup in a short-lived event loop, so the pooled connections are released here.
+        await close_session()
 
     if not valid_validators:
         raise NoValidatorsAvailableException
@@ -20,8 +20,8 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
-import time
-import uuid
+import asyncio
+
 from fastapi import Request
 from substrateinterface import Keypair
 
@@ -29,6 +29,7 @@ from communex.compat.key import classic_load_key
 from communex.types import Ss58Address
 
 from smartdrive.sign import sign_data
+from smartdrive.utils import generate_uuid
 from smartdrive.validator.api.exceptions import FileDoesNotExistException, UnexpectedErrorException
 from smartdrive.validator.api.middleware.api_middleware import get_ss58_address_from_public_key
 from smartdrive.validator.config import config_manager
@@ -64,11 +65,11 @@ class RemoveAPI:
         input_signed_params = request.headers.get("X-Signature")
         user_ss58_address = get_ss58_address_from_public_key(user_public_key)
 
-        file = self._database.get_file(user_ss58_address, file_uuid)
+        file = await asyncio.to_thread(self._database.get_file, user_ss58_address, file_uuid)
         if not file:
             raise FileDoesNotExistException
 
-        chunks = self._database.get_chunks(file_uuid)
+        chunks = await asyncio.to_thread(self._database.get_chunks, file_uuid)
         if not chunks:
             # Using the same error detail for both cases as the end-user experience is essentially the same
             raise FileDoesNotExistException
@@ -78,7 +79,7 @@ class RemoveAPI:
         signed_params = sign_data(event_params.dict(), self._key)
 
         event = RemoveEvent(
-            uuid=f"{int(time.time())}_{str(uuid.uuid4())}",
+            uuid=generate_uuid(),
             validator_ss58_address=Ss58Address(self._key.ss58_address),
             event_params=event_params,
             event_signed_params=signed_params.hex(),
@@ -25,7 +25,6 @@ import os
 import random
 import shutil
 import time
-import uuid
 from typing import Optional
 
 import aiofiles
@@ -37,7 +36,9 @@ from substrateinterface import Keypair
 from communex.types import Ss58Address
 
 from smartdrive.commune.errors import CommuneNetworkUnreachable
-from smartdrive.utils import DEFAULT_VALIDATOR_PATH
+from smartdrive.commune.utils import STREAM_CHUNK_SIZE_BYTES
+from smartdrive.logging_config import logger
+from smartdrive.utils import DEFAULT_VALIDATOR_PATH, generate_uuid
 from smartdrive.validator.api.exceptions import FileDoesNotExistException, \
     CommuneNetworkUnreachable as HTTPCommuneNetworkUnreachable, NoMinersInNetworkException, FileNotAvailableException, \
     ChunkNotAvailableException
@@ -52,6 +53,7 @@ from smartdrive.validator.node.node import Node
 
 
 MINER_RETRIEVE_TIMEOUT_SECONDS = 180
+MINER_RETRIEVE_HEDGE_DELAY_SECONDS = 30
 MAX_SIMULTANEOUS_DOWNLOADS = 4
 
 
@@ -88,11 +90,12 @@ class RetrieveAPI:
         user_public_key = request.headers.get("X-Key")
         user_ss58_address = get_ss58_address_from_public_key(user_public_key)
 
-        file = self._database.get_file(user_ss58_address, file_uuid)
+        # The database driver is blocking, so the queries run in a thread to keep the event loop serving requests
+        file = await asyncio.to_thread(self._database.get_file, user_ss58_address, file_uuid)
         if not file:
             raise FileDoesNotExistException
 
-        chunks = self._database.get_chunks(file_uuid)
+        chunks = await asyncio.to_thread(self._database.get_chunks, file_uuid)
         if not chunks:
             # Using the same error detail as above as the end-user experience is essentially the same
             raise FileDoesNotExistException
@@ -121,7 +124,7 @@ class RetrieveAPI:
             random.shuffle(miners_info_with_chunk_ordered_by_chunk_index[chunk_index])
 
         path = os.path.expanduser(DEFAULT_VALIDATOR_PATH)
-        user_path = os.path.join(path, f"{int(time.time())}_{str(uuid.uuid4())}")
+        user_path = os.path.join(path, generate_uuid())
         os.makedirs(user_path, exist_ok=True)
 
         async def cleanup(user_path: str):
@@ -130,35 +133,65 @@ class RetrieveAPI:
 
         background_tasks.add_task(cleanup, user_path)
 
+        async def _retrieve_from_miner(chunk_index, miner_info_with_chunk):
+            connection = ConnectionInfo(
+                miner_info_with_chunk["connection"]["ip"],
+                miner_info_with_chunk["connection"]["port"]
+            )
+            miner_info = ModuleInfo(
+                miner_info_with_chunk["uid"],
+                miner_info_with_chunk["ss58_address"],
+                connection
+            )
+            # Each miner writes to its own file, since the same chunk may be downloaded from several miners at once
+            chunk_file_index = f"{chunk_index}_{miner_info_with_chunk['uid']}"
+            chunk = await _retrieve_request(self._key, user_ss58_address, miner_info, miner_info_with_chunk["chunk_uuid"], chunk_file_index, user_path)
+            return miner_info, chunk
+
         async def _retrieve_request_task(chunk_index, miners_info_with_chunk, semaphore):
+            # Hedged retrieval: the next miner holding the chunk is requested when the current ones fail or take longer
+            # than MINER_RETRIEVE_HEDGE_DELAY_SECONDS. The first chunk received is used and the other requests are cancelled.
             async with semaphore:
-                for miner_info_with_chunk in miners_info_with_chunk:
-                    connection = ConnectionInfo(
-                        miner_info_with_chunk["connection"]["ip"],
-                        miner_info_with_chunk["connection"]["port"]
-                    )
-                    miner_info = ModuleInfo(
-                        miner_info_with_chunk["uid"],
-                        miner_info_with_chunk["ss58_address"],
-                        connection
-                    )
-                    chunk = await _retrieve_request(self._key, user_ss58_address, miner_info, miner_info_with_chunk["chunk_uuid"], chunk_index, user_path)
-                    if chunk:
-                        return chunk_index, chunk
+                start_time = time.monotonic()
+                remaining_miners_info_with_chunk = list(miners_info_with_chunk)
+                pending = set()
+
+                try:
+                    while remaining_miners_info_with_chunk or pending:
+                        if remaining_miners_info_with_chunk:
+                            miner_info_with_chunk = remaining_miners_info_with_chunk.pop(0)
+                            pending.add(asyncio.create_task(_retrieve_from_miner(chunk_index, miner_info_with_chunk)))
+
+                        hedge_delay = MINER_RETRIEVE_HEDGE_DELAY_SECONDS if remaining_miners_info_with_chunk else None
+                        done, pending = await asyncio.wait(pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED)
+
+                        for task in done:
+                            miner_info, chunk = task.result()
+                            if chunk:
+                                logger.debug("Chunk %s retrieved from %s in %.2f seconds", chunk_index, miner_info.ss58_address, time.monotonic() - start_time)
+                                return chunk_index, chunk
+                finally:
+                    for task in pending:
+                        task.cancel()
+
                 raise ChunkNotAvailableException
 
         semaphore = asyncio.Semaphore(MAX_SIMULTANEOUS_DOWNLOADS)
 
         retrieve_request_tasks = [
-            _retrieve_request_task(chunk_index, miners_info_with_chunk, semaphore)
+            asyncio.create_task(_retrieve_request_task(chunk_index, miners_info_with_chunk, semaphore))
             for chunk_index, miners_info_with_chunk in miners_info_with_chunk_ordered_by_chunk_index.items()
         ]
 
         try:
             retrieve_requests = await asyncio.gather(*retrieve_request_tasks)
         except ChunkNotAvailableException:
-            # If any chunk fails to be retrieved, we stop the process and raise the exception
-            shutil.rmtree(user_path)
+            # If any chunk fails to be retrieved, we stop the process and raise the exception. The pending downloads
+            # are cancelled so they do not keep writing into the user path once it is removed.
+            for retrieve_request_task in retrieve_request_tasks:
+                retrieve_request_task.cancel()
+            await asyncio.gather(*retrieve_request_tasks, return_exceptions=True)
+            shutil.rmtree(user_path, ignore_errors=True)
             raise FileNotAvailableException
 
         received_chunks = {chunk_index: chunk_path for chunk_index, chunk_path in retrieve_requests if chunk_path is not None}
@@ -167,16 +200,18 @@ class RetrieveAPI:
         if received_same_as_required_chunks:
 
             sorted_chunks = [received_chunks[i] for i in range(file.total_chunks)]
+            total_size = sum(os.path.getsize(chunk_path) for chunk_path in sorted_chunks)
+
             async def iter_combined_chunks():
                 for chunk_path in sorted_chunks:
                     async with aiofiles.open(chunk_path, 'rb') as f:
                         while True:
-                            chunk = await f.read(16384)
+                            chunk = await f.read(STREAM_CHUNK_SIZE_BYTES)
                             if not chunk:
                                 break
                             yield chunk
 
-            return StreamingResponse(iter_combined_chunks(), media_type='application/octet-stream')
+            return StreamingResponse(iter_combined_chunks(), media_type='application/octet-stream', headers={"Content-Length": str(total_size)})
 
         else:
             raise FileNotAvailableException
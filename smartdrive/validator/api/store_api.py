@@ -26,11 +26,10 @@ import os
 import random
 import shutil
 import time
-import uuid
 from typing import Optional, Tuple, List, Union, AsyncGenerator
 
 import aiofiles
-from fastapi import Request
+from fastapi import Request, BackgroundTasks
 from starlette.responses import JSONResponse
 from substrateinterface import Keypair
 
@@ -39,7 +38,7 @@ from communex.types import Ss58Address
 
 from smartdrive.check_file import check_file
 from smartdrive.commune.errors import CommuneNetworkUnreachable
-from smartdrive.utils import DEFAULT_VALIDATOR_PATH
+from smartdrive.utils import DEFAULT_VALIDATOR_PATH, generate_uuid
 from smartdrive.sign import sign_data
 from smartdrive.validator.api.exceptions import RedundancyException, NoMinersInNetworkException, \
     NoValidMinerResponseException, UnexpectedErrorException, HTTPRedundancyException, \
@@ -54,6 +53,7 @@ from smartdrive.models.event import StoreEvent, StoreParams, StoreInputParams, C
 from smartdrive.validator.models.models import MinerWithChunk, ModuleType
 from smartdrive.commune.request import execute_miner_request, get_filtered_modules
 from smartdrive.commune.models import ModuleInfo
+from smartdrive.validator.node.connection.connection_pool import Connection
 from smartdrive.validator.node.connection.utils.utils import send_message
 from smartdrive.validator.node.node import Node
 from smartdrive.validator.node.util.exceptions import InvalidSignatureException
@@ -104,7 +104,7 @@ class StoreAPI:
         user_public_key = request.headers.get("X-Key")
         user_ss58_address = get_ss58_address_from_public_key(user_public_key)
         input_signed_params = request.headers.get("X-Signature")
-        file_uuid = f"{int(time.time())}_{str(uuid.uuid4())}"
+        file_uuid = generate_uuid()
         total_stake = request.state.total_stake
 
         validate_storage_capacity(
@@ -118,7 +118,7 @@ class StoreAPI:
         signed_params = sign_data(event_params.dict(), self._key)
 
         event = StoreRequestEvent(
-            uuid=f"{int(time.time())}_{str(uuid.uuid4())}",
+            uuid=generate_uuid(),
             validator_ss58_address=Ss58Address(self._key.ss58_address),
             event_params=event_params,
             event_signed_params=signed_params.hex(),
@@ -165,15 +165,17 @@ class StoreAPI:
         else:
             raise StoreRequestNotApprovedException
 
-    async def store_endpoint(self, request: Request):
+    async def store_endpoint(self, request: Request, background_tasks: BackgroundTasks):
         """
         Stores a file across multiple active miners.
 
         This method reads a file uploaded by a user and distributes it among active miners available in the SmartDrive network.
-        Once it is distributed sends an event with the related info.
+        Once it is distributed sends an event with the related info. The validation events of the other validators are
+        signed and sent after the response.
 
         Params:
             request (Request): The incoming request containing necessary headers for validation.
+            background_tasks (BackgroundTasks): Tasks executed once the response is sent.
 
         Raises:
             FileDoesNotExistException: If the file is bigger than allowed.
@@ -237,28 +239,37 @@ class StoreAPI:
 
             if validations_events_per_validator:
                 self._database.insert_validation_events(validation_events=validations_events_per_validator.pop(0))
+                background_tasks.add_task(self._send_validation_events, active_connections, validations_events_per_validator)
 
-                for index, active_connection in enumerate(active_connections):
-                    data_list = [validations_events.dict() for validations_events in validations_events_per_validator[index]]
+            return JSONResponse(content=None, status_code=200)  # status_code 204 throw errors
 
-                    body = MessageBody(
-                        code=MessageCode.MESSAGE_CODE_VALIDATION_EVENTS,
-                        data={"list": data_list}
-                    )
+        except InvalidSignatureException:
+            raise UnexpectedErrorException()
 
-                    body_sign = sign_data(body.dict(), self._key)
+    def _send_validation_events(self, active_connections: List[Connection], validations_events_per_validator: List[List[ValidationEvent]]):
+        """
+        Sign and send to each active validator its own validation events.
 
-                    message = Message(
-                        body=body,
-                        signature_hex=body_sign.hex(),
-                        public_key_hex=self._key.public_key.hex()
-                    )
-                    send_message(active_connection, message)
+        Params:
+            active_connections (List[Connection]): The connections of the active validators.
+            validations_events_per_validator (List[List[ValidationEvent]]): The validation events of each active validator, in the same order as the connections.
+        """
+        for index, active_connection in enumerate(active_connections):
+            data_list = [validations_events.dict() for validations_events in validations_events_per_validator[index]]
 
-            return JSONResponse(content=None, status_code=200)  # status_code 204 throw errors
+            body = MessageBody(
+                code=MessageCode.MESSAGE_CODE_VALIDATION_EVENTS,
+                data={"list": data_list}
+            )
 
-        except InvalidSignatureException:
-            raise UnexpectedErrorException()
+            body_sign = sign_data(body.dict(), self._key)
+
+            message = Message(
+                body=body,
+                signature_hex=body_sign.hex(),
+                public_key_hex=self._key.public_key.hex()
+            )
+            send_message(active_connection, message)
 
 
 async def store_new_file(
@@ -273,7 +284,7 @@ async def store_new_file(
         file_size_bytes: int = None,
 ) -> Tuple[Optional[StoreEvent], List[List[ValidationEvent]]]:
     validating = isinstance(file, str)
-    store_event_uuid = f"{int(time.time())}_{str(uuid.uuid4())}"
+    store_event_uuid = generate_uuid()
 
     if not validating and len(miners) < MIN_MINERS_FOR_FILE:
         raise RedundancyException
@@ -287,7 +298,7 @@ async def store_new_file(
     chunks_params: List[ChunkParams] = []
 
     if not file_uuid:
-        file_uuid = f"{int(time.time())}_{str(uuid.uuid4())}"
+        file_uuid = generate_uuid()
 
     async def handle_store_request(miner: ModuleInfo, chunk_path: str, chunk_index: int) -> bool:
         miner_answer = await _store_request(
@@ -406,7 +417,7 @@ async def store_new_file(
                         sub_chunk_start=sub_chunk_start,
                         sub_chunk_end=sub_chunk_end,
                         sub_chunk_encoded=sub_chunk_encoded,
-                        file_uuid=f"{int(time.time())}_{str(uuid.uuid4())}" if validating else file_uuid,
+                        file_uuid=generate_uuid() if validating else file_uuid,
                         user_owner_ss58_address=user_ss58_address
                     )
 
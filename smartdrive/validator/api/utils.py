@@ -30,6 +30,10 @@ from smartdrive.validator.utils import calculate_storage_capacity
 from smartdrive.validator.api.exceptions import StorageLimitException, FileTooLargeException
 from smartdrive.validator.database.database import Database
 
+# A removal is a small request, so short attempts are retried instead of waiting on a single long one
+REMOVE_CHUNK_TIMEOUT_SECONDS = 3
+REMOVE_CHUNK_RETRIES = 2
+
 
 async def remove_chunk_request(keypair: Keypair, user_ss58_address: Ss58Address, miner: ModuleInfo, chunk_uuid: str) -> bool:
     """
@@ -53,7 +57,9 @@ async def remove_chunk_request(keypair: Keypair, user_ss58_address: Ss58Address,
         {
             "folder": user_ss58_address,
             "chunk_uuid": chunk_uuid
-        }
+        },
+        timeout=REMOVE_CHUNK_TIMEOUT_SECONDS,
+        retries=REMOVE_CHUNK_RETRIES
     )
     return True if miner_answer else False
 
@@ -20,17 +20,15 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import threading
 import time
 from _socket import SocketType
 from contextlib import contextmanager
-from multiprocessing import Manager
-from multiprocessing.managers import DictProxy
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Set
 
 from communex.types import Ss58Address
 
 from smartdrive.commune.models import ModuleInfo
-from smartdrive.validator.node.connection.utils.lock_proxy_wrapper import LockProxyWrapper
 from smartdrive.validator.node.util.exceptions import ConnectionPoolMaxSizeReached
 
 # Warning: PING_INTERVAL_SECONDS should always be considerably less than INACTIVITY_TIMEOUT_SECONDS
@@ -39,7 +37,9 @@ INACTIVITY_TIMEOUT_SECONDS = 10
 
 
 class Connection:
-    def __init__(self, module: ModuleInfo, ping: float, socket: SocketType, write_lock: LockProxyWrapper):
+    __slots__ = ("module", "ping", "socket", "_write_lock")
+
+    def __init__(self, module: ModuleInfo, ping: float, socket: SocketType, write_lock: threading.Lock):
         self.module = module
         self.ping = ping
         self.socket = socket
@@ -56,11 +56,12 @@ class Connection:
 
 class ConnectionPool:
 
-    def __init__(self, manager: Manager, cache_size):
-        self._connections: DictProxy[Ss58Address, Connection] = manager.dict()
-        self._manager = manager
+    def __init__(self, cache_size):
+        # The pool is only shared between threads of the validator process, so plain objects are used instead of
+        # manager proxies, which pickle every operation through the manager process
+        self._connections: Dict[Ss58Address, Connection] = {}
         self._cache_size = cache_size
-        self._lock: LockProxyWrapper = manager.Lock()
+        self._lock = threading.RLock()
 
     def get(self, identifier) -> Optional[Connection]:
         with self._lock:
@@ -70,11 +71,21 @@ class ConnectionPool:
         return None
 
     def get_all(self) -> List[Connection]:
-        # Ignore the warning, the values method is returning the values not a list[tuple[_KT, _VT]]
-        return self._connections.values()
+        with self._lock:
+            return list(self._connections.values())
 
     def get_identifiers(self) -> List[Ss58Address]:
-        return self._connections.keys()
+        with self._lock:
+            return list(self._connections.keys())
+
+    def contains(self, identifier) -> bool:
+        with self._lock:
+            return identifier in self._connections
+
+    def diff_identifiers(self, identifiers: Iterable[Ss58Address]) -> Set[Ss58Address]:
+        # Identifiers in the pool that are not in identifiers, computed in a single lock scope
+        with self._lock:
+            return self._connections.keys() - identifiers
 
     def get_actives(self, identifier) -> Optional[Connection]:
         with self._lock:
@@ -91,10 +102,10 @@ class ConnectionPool:
 
     def update_or_append(self, identifier: Ss58Address, module_info: ModuleInfo, socket: SocketType) -> Connection:
         with self._lock:
-            connection = Connection(module_info, time.monotonic(), socket, self._manager.Lock())
+            connection = Connection(module_info, time.monotonic(), socket, threading.Lock())
 
             if identifier not in self._connections:
-                if len(self._connections) <= self._cache_size:
+                if len(self._connections) < self._cache_size:
                     self._connections[identifier] = connection
                 else:
                     raise ConnectionPoolMaxSizeReached(f"Max num of connections reached {self._cache_size}")
@@ -106,15 +117,14 @@ class ConnectionPool:
 
     def update_ping(self, identifier):
         with self._lock:
-            if identifier in self._connections:
-                # The manager do not keep track on attributes but object instead
-                _time = time.monotonic()
-                connection = self._connections[identifier]
-                connection.ping = _time
-                self._connections[identifier] = connection
+            connection = self._connections.get(identifier)
+            if connection:
+                connection.ping = time.monotonic()
 
-    def remove(self, identifier: Ss58Address):
-        self._connections.pop(identifier, None)
+    def remove(self, identifier: Ss58Address) -> Optional[SocketType]:
+        with self._lock:
+            connection = self._connections.pop(identifier, None)
+            return connection.socket if connection else None
 
     def remove_multiple(self, identifiers: List[Ss58Address]) -> List[SocketType]:
         sockets = []
@@ -128,9 +138,8 @@ class ConnectionPool:
     def remove_inactive(self) -> List[SocketType]:
         with self._lock:
             current_time = time.monotonic()
-            connections_to_remove = [identifier for identifier, c in self._connections.items() if current_time - c.ping > INACTIVITY_TIMEOUT_SECONDS]
-            sockets_to_remove = [self._connections[identifier].socket for identifier in connections_to_remove]
+            connections_to_remove = [(identifier, c.socket) for identifier, c in self._connections.items() if current_time - c.ping > INACTIVITY_TIMEOUT_SECONDS]
 
-            for identifier in connections_to_remove:
+            for identifier, _ in connections_to_remove:
                 del self._connections[identifier]
-            return sockets_to_remove
+            return [socket for _, socket in connections_to_remove]
@@ -21,17 +21,17 @@
 #  SOFTWARE.
 
 import asyncio
-import multiprocessing
+import random
 import socket
 import select
 import threading
 from multiprocessing import Value
-from time import sleep
+from time import sleep, monotonic
+from typing import Dict, Optional, Tuple
 
 from communex.compat.key import classic_load_key
 from substrateinterface import Keypair
 
-import smartdrive.validator.node.connection.utils.utils
 from smartdrive.commune.models import ModuleInfo
 from smartdrive.logging_config import logger
 from smartdrive.commune.request import get_filtered_modules
@@ -42,173 +42,256 @@ from smartdrive.validator.evaluation.evaluation import MAX_ALLOWED_UIDS
 from smartdrive.validator.models.models import ModuleType
 from smartdrive.validator.node.connection.peer import Peer
 from smartdrive.validator.node.connection.connection_pool import ConnectionPool, PING_INTERVAL_SECONDS
-from smartdrive.validator.node.connection.utils.utils import connect_to_peer
+from smartdrive.validator.node.connection.utils.utils import connect_to_peer, receive_msg_async, configure_peer_socket, pack_message, \
+    broadcast_message
 from smartdrive.validator.node.event.event_pool import EventPool
 from smartdrive.validator.node.util.exceptions import ConnectionPoolMaxSizeReached
 from smartdrive.validator.node.util.message import MessageBody, Message, MessageCode
 from smartdrive.validator.node.connection.utils.utils import send_message
 
 
-class PeerManager(multiprocessing.Process):
+class PeerManager(threading.Thread):
     MAX_N_CONNECTIONS = MAX_ALLOWED_UIDS - 1
     IDENTIFIER_TIMEOUT_SECONDS = 5
     CONNECTION_PROCESS_TIMEOUT_SECONDS = 10
+    MAX_DISCOVERY_RETRY_DELAY_SECONDS = 5 * 60  # 5 minutes
     TCP_RESTART_INTERVAL_SECONDS = 8 * 60 * 60  # 8 hours
+    VALIDATORS_CACHE_TTL_SECONDS = 5
 
     _event_pool: EventPool = None
     _connection_pool: ConnectionPool = None
     _initial_sync_completed: Value = None
     _keypair: Keypair = None
-    _connecting_validators: set = None
+    _validators_cache: Optional[Tuple[float, Dict[str, ModuleInfo]]] = None
+    _discovery_wakeup: threading.Event = None
+    _identifier_message_data: bytes = None
+    _identifier_ok_message: Message = None
+    _ping_message: Message = None
 
     def __init__(self, event_pool: EventPool, initial_sync_completed: Value, connection_pool: ConnectionPool):
-        multiprocessing.Process.__init__(self)
+        threading.Thread.__init__(self)
         self._event_pool = event_pool
         self._connection_pool = connection_pool
         self._initial_sync_completed = initial_sync_completed
         self._keypair = classic_load_key(config_manager.config.key)
-        self._connecting_validators = set()
+        self._discovery_wakeup = threading.Event()
 
-    def run(self):
-        listening_socket = None
+        # These messages never change, so they are signed once instead of on every handshake or ping round
+        self._identifier_message_data = pack_message(self._create_signed_message(MessageCode.MESSAGE_CODE_IDENTIFIER))
+        self._identifier_ok_message = self._create_signed_message(MessageCode.MESSAGE_CODE_IDENTIFIER_OK)
+        self._ping_message = self._create_signed_message(MessageCode.MESSAGE_CODE_PING)
 
+    def run(self):
         try:
             threading.Thread(target=self._discovery).start()
             threading.Thread(target=self._periodically_ping_nodes).start()
             threading.Thread(target=self._restart_connections_periodically).start()
 
-            listening_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            asyncio.run(self._accept_connections())
+
+        except Exception:
+            logger.error("Peer manager stopped unexpectedly", exc_info=True)
+
+    async def _accept_connections(self):
+        """
+        Accept incoming peer connections and handle their handshakes in this event loop.
+
+        Handshakes are mostly spent waiting on the network, so they run as tasks of a single event loop instead of
+        spawning a thread with its own event loop per incoming connection.
+        """
+        loop = asyncio.get_running_loop()
+        # Keep a reference to the running handshakes, so they are not garbage collected while pending
+        handshake_tasks = set()
+
+        listening_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
             listening_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # The accepted sockets inherit these options from the listening socket
+            configure_peer_socket(listening_socket)
             listening_socket.bind(("0.0.0.0", config_manager.config.port + 1))
             listening_socket.listen(self.MAX_N_CONNECTIONS)
+            listening_socket.setblocking(False)
 
             while True:
-                peer_socket, address = listening_socket.accept()
-                threading.Thread(target=self._handle_connection, args=(peer_socket, address,)).start()
-
-        except Exception:
-            logger.error(f"Peer manager stopped unexpectedly - PID: {self.pid}", exc_info=True)
+                accepted_connections = [await loop.sock_accept(listening_socket)]
+
+                # Validators reconnect in bursts after a restart or a network issue, so the connections already
+                # waiting in the backlog are accepted in this same wakeup instead of one per loop iteration
+                while len(accepted_connections) < self.MAX_N_CONNECTIONS:
+                    try:
+                        peer_socket, address = listening_socket.accept()
+                    except BlockingIOError:
+                        break
+                    peer_socket.setblocking(False)
+                    accepted_connections.append((peer_socket, address))
+
+                for peer_socket, address in accepted_connections:
+                    task = loop.create_task(self._handle_connection(peer_socket, address))
+                    handshake_tasks.add(task)
+                    task.add_done_callback(handshake_tasks.discard)
 
         finally:
-            if listening_socket:
-                listening_socket.close()
+            listening_socket.close()
 
-    def _handle_connection(self, peer_socket, peer_address):
-        async def handle_connection():
-            validator_connection = None
+    async def _handle_connection(self, peer_socket, peer_address):
+        validator_connection = None
+        try:
+            # Wait self.IDENTIFIER_TIMEOUT_SECONDS as maximum time to get the identifier message
             try:
-                # Wait self.IDENTIFIER_TIMEOUT_SECONDS as maximum time to get the identifier message
-                ready = select.select([peer_socket], [], [], self.IDENTIFIER_TIMEOUT_SECONDS)
-                if not ready[0]:
-                    logger.debug(f"Timeout: No identification from {peer_address}")
-                    peer_socket.close()
-                    return
-
-                json_message = smartdrive.validator.node.connection.utils.utils.receive_msg(peer_socket)
-                message = Message(**json_message)
-                if message.body.code != MessageCode.MESSAGE_CODE_IDENTIFIER:
-                    logger.debug("Invalid message code received")
-                    peer_socket.close()
-                    return
-
-                signature_hex = message.signature_hex
-                public_key_hex = message.public_key_hex
-                ss58_address = get_ss58_address_from_public_key(public_key_hex)
-
-                logger.debug(f"Identification message received {ss58_address}")
-
-                is_verified_signature = verify_data_signature(message.body.dict(), signature_hex, ss58_address)
-                if not is_verified_signature:
-                    logger.debug(f"Invalid signature for {ss58_address}")
-                    peer_socket.close()
-                    return
-
-                active_connection = self._connection_pool.get_actives(ss58_address)
-                if active_connection:
-                    logger.debug(f"Peer {ss58_address} is already active")
-                    peer_socket.close()
-                    return
-
-                validators = await get_filtered_modules(config_manager.config.netuid, ModuleType.VALIDATOR, config_manager.config.testnet)
-                if not validators:
-                    logger.debug("No active validators found")
-                    peer_socket.close()
-                    return
-
-                validator_connection = next((validator for validator in validators if validator.ss58_address == ss58_address), None)
-                if not validator_connection:
-                    logger.info(f"Validator {ss58_address} is not valid")
-                    peer_socket.close()
-                    return
-
-                # TODO: review later
-                # Check that the connection related to the validator modules is the same as address
-                # if peer_address[0] != validator_connection.connection.ip:
-                #     logger.info(f"Validator {ss58_address} connected from wrong address {peer_address}")
-                #     peer_socket.close()
-                #     return
+                json_message = await asyncio.wait_for(receive_msg_async(peer_socket), self.IDENTIFIER_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.debug(f"Timeout: No identification from {peer_address}")
+                peer_socket.close()
+                return
 
-                try:
-                    connection = self._connection_pool.update_or_append(validator_connection.ss58_address, validator_connection, peer_socket)
-
-                    body = MessageBody(
-                        code=MessageCode.MESSAGE_CODE_IDENTIFIER_OK
-                    )
-                    body_sign = sign_data(body.dict(), self._keypair)
-                    message = Message(
-                        body=body,
-                        signature_hex=body_sign.hex(),
-                        public_key_hex=self._keypair.public_key.hex()
-                    )
-                    send_message(connection, message)
-
-                    Peer(connection, self._connection_pool, self._event_pool, self._initial_sync_completed).start()
-                    logger.debug(f"Peer {ss58_address} connected from {peer_address}")
-                except ConnectionPoolMaxSizeReached:
-                    logger.debug(f"Connection pool full for {ss58_address}", exc_info=True)
-                    peer_socket.close()
+            message = Message(**json_message)
+            if message.body.code != MessageCode.MESSAGE_CODE_IDENTIFIER:
+                logger.debug("Invalid message code received")
+                peer_socket.close()
+                return
 
-            except Exception:
-                logger.error("Error handling connection", exc_info=True)
+            signature_hex = message.signature_hex
+            public_key_hex = message.public_key_hex
+            ss58_address = get_ss58_address_from_public_key(public_key_hex)
 
-                if validator_connection:
-                    self._connection_pool.remove(validator_connection.ss58_address)
+            logger.debug(f"Identification message received {ss58_address}")
 
-                if peer_socket:
-                    peer_socket.close()
+            is_verified_signature = verify_data_signature(message.body.dict(), signature_hex, ss58_address)
+            if not is_verified_signature:
+                logger.debug(f"Invalid signature for {ss58_address}")
+                peer_socket.close()
+                return
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(handle_connection())
-        loop.close()
+            active_connection = self._connection_pool.get_actives(ss58_address)
+            if active_connection:
+                logger.debug(f"Peer {ss58_address} is already active")
+                peer_socket.close()
+                return
+
+            validators = await self._get_validators()
+            if not validators:
+                logger.debug("No active validators found")
+                peer_socket.close()
+                return
+
+            validator_connection = validators.get(ss58_address)
+            if not validator_connection:
+                logger.info(f"Validator {ss58_address} is not valid")
+                peer_socket.close()
+                return
+
+            # TODO: review later
+            # Check that the connection related to the validator modules is the same as address
+            # if peer_address[0] != validator_connection.connection.ip:
+            #     logger.info(f"Validator {ss58_address} connected from wrong address {peer_address}")
+            #     peer_socket.close()
+            #     return
+
+            try:
+                # The socket was accepted in non-blocking mode, but the peer thread reads it with blocking calls
+                peer_socket.setblocking(True)
+                connection = self._connection_pool.update_or_append(validator_connection.ss58_address, validator_connection, peer_socket)
+                self._discovery_wakeup.set()
+
+                send_message(connection, self._identifier_ok_message)
+
+                Peer(connection, self._connection_pool, self._event_pool, self._initial_sync_completed).start()
+                logger.debug(f"Peer {ss58_address} connected from {peer_address}")
+            except ConnectionPoolMaxSizeReached:
+                logger.debug(f"Connection pool full for {ss58_address}", exc_info=True)
+                peer_socket.close()
+
+        except Exception:
+            logger.error("Error handling connection", exc_info=True)
+
+            if validator_connection:
+                self._connection_pool.remove(validator_connection.ss58_address)
+
+            if peer_socket:
+                peer_socket.close()
+
+    def _create_signed_message(self, code: MessageCode) -> Message:
+        """
+        Create a message without data signed with the validator key.
+
+        Params:
+            code (MessageCode): The code of the message.
+
+        Returns:
+            Message: The signed message.
+        """
+        body = MessageBody(
+            code=code
+        )
+        body_sign = sign_data(body.dict(), self._keypair)
+
+        return Message(
+            body=body,
+            signature_hex=body_sign.hex(),
+            public_key_hex=self._keypair.public_key.hex()
+        )
+
+    async def _get_validators(self) -> Dict[str, ModuleInfo]:
+        """
+        Retrieve the validators of the subnet, reusing the last result for VALIDATORS_CACHE_TTL_SECONDS.
+
+        Every incoming handshake and every discovery round needs the validators, so they are filtered once and shared
+        instead of being queried again for each of them.
+
+        Returns:
+            Dict[str, ModuleInfo]: The validators of the subnet by ss58 address. The dict is shared, so it must not be
+                                   modified.
+
+        Raises:
+            CommuneNetworkUnreachable: Raised if a valid result cannot be obtained from the network.
+        """
+        # The cache entry is replaced as a whole, so the handshakes and the discovery thread always read a
+        # consistent pair without locking
+        validators_cache = self._validators_cache
+        if validators_cache and monotonic() - validators_cache[0] < self.VALIDATORS_CACHE_TTL_SECONDS:
+            return validators_cache[1]
+
+        validators = await get_filtered_modules(config_manager.config.netuid, ModuleType.VALIDATOR, config_manager.config.testnet)
+        validators_by_ss58_address = {validator.ss58_address: validator for validator in validators}
+        self._validators_cache = (monotonic(), validators_by_ss58_address)
+        return validators_by_ss58_address
 
     def _discovery(self):
         async def discovery():
+            retry_delay = self.CONNECTION_PROCESS_TIMEOUT_SECONDS
+
             while True:
                 try:
-                    validators = await get_filtered_modules(config_manager.config.netuid, ModuleType.VALIDATOR, config_manager.config.testnet)
-                    validators_ss58_addresses = {validator.ss58_address for validator in validators}
+                    self._discovery_wakeup.clear()
+                    validators = await self._get_validators()
 
-                    unregistered_validators_ss8_addresses = [ss58_address for ss58_address in self._connection_pool.get_identifiers() if ss58_address not in validators_ss58_addresses]
-                    removed_connections = self._connection_pool.remove_multiple(unregistered_validators_ss8_addresses)
+                    unregistered_validators_ss8_addresses = self._connection_pool.diff_identifiers(validators.keys())
+                    removed_connections = self._connection_pool.remove_multiple(list(unregistered_validators_ss8_addresses))
                     for removed_connection in removed_connections:
                         removed_connection.close()
 
-                    connected_ss58_addresses = self._connection_pool.get_identifiers()
-                    new_registered_validators = [
-                        validator for validator in validators
-                        if validator.ss58_address not in connected_ss58_addresses and validator.ss58_address != self._keypair.ss58_address
+                    new_registered_validators_ss58_addresses = [
+                        ss58_address for ss58_address in validators
+                        if ss58_address != self._keypair.ss58_address and not self._connection_pool.contains(ss58_address)
                     ]
-                    for validator in new_registered_validators:
-                        if validator.ss58_address not in self._connecting_validators:
-                            self._connecting_validators.add(validator.ss58_address)
-                            threading.Thread(target=self._connect_to_peer, args=(validator,)).start()
+                    # The handshakes are mostly network round trips, so they are overlapped instead of made one by one
+                    await asyncio.gather(*[
+                        self._connect_to_peer(validators[ss58_address])
+                        for ss58_address in new_registered_validators_ss58_addresses
+                    ])
+
+                    retry_delay = self.CONNECTION_PROCESS_TIMEOUT_SECONDS
+
+                    # Wait for the next round, or less if a peer connected or connections were dropped, so the
+                    # pool is reconciled as soon as possible
+                    await asyncio.to_thread(self._discovery_wakeup.wait, self.CONNECTION_PROCESS_TIMEOUT_SECONDS)
 
                 except Exception:
                     logger.error("Error discovering new validators", exc_info=True)
 
-                finally:
-                    await asyncio.sleep(self.CONNECTION_PROCESS_TIMEOUT_SECONDS)
+                    # Back off while the network keeps failing, with jitter so the validators do not retry in lockstep
+                    await asyncio.sleep(retry_delay + random.uniform(0, retry_delay * 0.1))
+                    retry_delay = min(retry_delay * 2, self.MAX_DISCOVERY_RETRY_DELAY_SECONDS)
 
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
@@ -217,31 +300,18 @@ class PeerManager(multiprocessing.Process):
 
     def _periodically_ping_nodes(self):
         while True:
-            connections = self._connection_pool.get_all()
-
-            for connection in connections:
-                try:
-                    body = MessageBody(
-                        code=MessageCode.MESSAGE_CODE_PING
-                    )
-
-                    body_sign = sign_data(body.dict(), self._keypair)
-
-                    message = Message(
-                        body=body,
-                        signature_hex=body_sign.hex(),
-                        public_key_hex=self._keypair.public_key.hex()
-                    )
-
-                    send_message(connection, message)
-
-                except Exception:
-                    logger.debug("Error pinging node")
+            try:
+                broadcast_message(self._connection_pool.get_all(), self._ping_message)
+            except Exception:
+                logger.debug("Error pinging nodes")
 
             inactive_connections = self._connection_pool.remove_inactive()
             for inactive_connection in inactive_connections:
                 inactive_connection.close()
 
+            if inactive_connections:
+                self._discovery_wakeup.set()
+
             sleep(PING_INTERVAL_SECONDS)
 
     def _restart_connections_periodically(self):
@@ -260,11 +330,14 @@ class PeerManager(multiprocessing.Process):
                 except Exception as e:
                     logger.error(f"Error restarting connection for {connection.module.ss58_address}: {e}")
 
-    def _connect_to_peer(self, validator: ModuleInfo):
+            if connections:
+                self._discovery_wakeup.set()
+
+    async def _connect_to_peer(self, validator: ModuleInfo):
         peer_socket = None
 
         try:
-            peer_socket = connect_to_peer(self._keypair, validator)
+            peer_socket = await connect_to_peer(self._identifier_message_data, validator)
             if peer_socket:
                 connection = self._connection_pool.update_or_append(validator.ss58_address, validator, peer_socket)
                 Peer(connection, self._connection_pool, self._event_pool, self._initial_sync_completed).start()
@@ -276,5 +349,3 @@ class PeerManager(multiprocessing.Process):
 
             if peer_socket:
                 peer_socket.close()
-        finally:
-            self._connecting_validators.discard(validator.ss58_address)
@@ -20,64 +20,98 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import asyncio
 import json
 import select
 import socket
 import struct
 import threading
 from _socket import SocketType
-from typing import Union
+from typing import List, Union
 
-from substrateinterface import Keypair
 
 from smartdrive import logger
 from smartdrive.commune.models import ModuleInfo
 from smartdrive.commune.utils import get_ss58_address_from_public_key
-from smartdrive.sign import sign_data, verify_data_signature
+from smartdrive.sign import verify_data_signature
 from smartdrive.validator.node.connection.connection_pool import Connection
 from smartdrive.validator.node.util.exceptions import ClientDisconnectedException, MessageException, \
     InvalidSignatureException
-from smartdrive.validator.node.util.message import MessageBody, MessageCode, Message
+from smartdrive.validator.node.util.message import MessageCode, Message
 
+# A dead peer only costs the connect timeout, since the dials run concurrently. It still leaves room for the SYN
+# retransmissions of a slow link.
+CONNECT_TIMEOUT_SECONDS = 3
 CONNECTION_TIMEOUT_SECONDS = 5
+SOCKET_BUFFER_SIZE_BYTES = 4 * 1024 * 1024  # 4 MB
 
 
-def connect_to_peer(keypair: Keypair, module_info: ModuleInfo) -> Union[SocketType, None]:
-    peer_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+def configure_peer_socket(peer_socket: SocketType):
+    """
+    Tune a peer socket for the peer protocol.
+
+    Most messages, such as identifiers and pings, are small and answered right away, so Nagle's algorithm is disabled
+    to send them immediately. The buffers are enlarged for the block synchronization messages. The buffers should be
+    set before connecting or listening, because the TCP window scaling is negotiated during the handshake.
+
+    Params:
+        peer_socket (SocketType): The socket to configure.
+    """
+    peer_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    peer_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE_BYTES)
+    peer_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE_BYTES)
+
+
+async def connect_to_peer(identifier_message_data: bytes, module_info: ModuleInfo) -> Union[SocketType, None]:
+    """
+    Connect to a peer and identify against it without blocking the running event loop.
 
-    peer_socket.settimeout(CONNECTION_TIMEOUT_SECONDS)
-    peer_socket.connect((module_info.connection.ip, module_info.connection.port + 1))
-    # When you call settimeout(), the timeout applies to all subsequent blocking operations on the socket, such as connect(), recv(), send(), and others.
-    # Since we only want to set the timeout at the connection level, it should be reset.
-    peer_socket.settimeout(None)
+    Params:
+        identifier_message_data (bytes): The signed identifier message, as returned by `pack_message`.
+        module_info (ModuleInfo): The validator module to connect to.
 
-    body = MessageBody(
-        code=MessageCode.MESSAGE_CODE_IDENTIFIER
-    )
+    Returns:
+        Union[SocketType, None]: The connected socket in blocking mode if the peer accepted the identification,
+                                 otherwise None.
 
-    body_sign = sign_data(body.dict(), keypair)
+    Raises:
+        InvalidSignatureException: If the answer of the peer is not properly signed.
+        asyncio.TimeoutError: If the peer does not connect within CONNECT_TIMEOUT_SECONDS or answer within
+                              CONNECTION_TIMEOUT_SECONDS.
+    """
+    loop = asyncio.get_running_loop()
+    peer_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    configure_peer_socket(peer_socket)
+    peer_socket.setblocking(False)
 
-    message = Message(
-        body=body,
-        signature_hex=body_sign.hex(),
-        public_key_hex=keypair.public_key.hex()
-    )
+    try:
+        await asyncio.wait_for(
+            loop.sock_connect(peer_socket, (module_info.connection.ip, module_info.connection.port + 1)),
+            CONNECT_TIMEOUT_SECONDS
+        )
 
-    _send_json_with_socket(socket=peer_socket, obj=message.dict())
-    json_message = receive_msg(peer_socket)
-    message = Message(**json_message)
+        await loop.sock_sendall(peer_socket, identifier_message_data)
+        json_message = await asyncio.wait_for(receive_msg_async(peer_socket), CONNECTION_TIMEOUT_SECONDS)
+        message = Message(**json_message)
 
-    signature_hex = message.signature_hex
-    public_key_hex = message.public_key_hex
-    ss58_address = get_ss58_address_from_public_key(public_key_hex)
+        signature_hex = message.signature_hex
+        public_key_hex = message.public_key_hex
+        ss58_address = get_ss58_address_from_public_key(public_key_hex)
 
-    is_verified_signature = verify_data_signature(message.body.dict(), signature_hex, ss58_address)
-    if not is_verified_signature:
-        raise InvalidSignatureException()
+        is_verified_signature = verify_data_signature(message.body.dict(), signature_hex, ss58_address)
+        if not is_verified_signature:
+            raise InvalidSignatureException()
 
-    if message.body.code == MessageCode.MESSAGE_CODE_IDENTIFIER_OK:
-        return peer_socket
+        if message.body.code == MessageCode.MESSAGE_CODE_IDENTIFIER_OK:
+            # The peer threads read and write the socket with blocking calls
+            peer_socket.setblocking(True)
+            return peer_socket
 
+    except Exception:
+        peer_socket.close()
+        raise
+
+    peer_socket.close()
     return None
 
 
@@ -92,7 +126,8 @@ def receive_msg(sock):
 
     data = _recv_all(sock, msg_len)
 
-    obj = json.loads(data.decode('utf-8'))
+    # json.loads decodes the received bytes directly, without an intermediate str copy of the message
+    obj = json.loads(data)
 
     return obj
 
@@ -108,28 +143,98 @@ def _recv_all(sock, length):
     return data
 
 
+async def receive_msg_async(sock):
+    """
+    Receive a message from a non-blocking socket without blocking the running event loop.
+
+    Params:
+        sock (SocketType): The non-blocking socket to read the message from.
+
+    Returns:
+        dict: The decoded JSON message.
+
+    Raises:
+        ClientDisconnectedException: If the peer closes the connection before the message is complete.
+    """
+    msg_hdr = await _recv_all_async(sock, 4)
+    msg_len = struct.unpack('!I', msg_hdr)[0]
+
+    data = await _recv_all_async(sock, msg_len)
+
+    obj = json.loads(data)
+
+    return obj
+
+
+async def _recv_all_async(sock, length):
+    """ Helper function to receive all data for a given length from a non-blocking socket. """
+    loop = asyncio.get_running_loop()
+    data = bytearray()
+    while len(data) < length:
+        packet = await loop.sock_recv(sock, length - len(data))
+        if not packet:
+            raise ClientDisconnectedException('Client disconnected')
+        data.extend(packet)
+    return data
+
+
 def send_message(connection: Connection, message: Message):
     threading.Thread(target=_send_json_with_connection, args=(connection, message.dict(),)).start()
 
 
+def broadcast_message(connections: List[Connection], message: Message):
+    """
+    Send the same message to several peers.
+
+    The message is serialized and framed once, and the resulting bytes are written to every connection, instead of
+    serializing the whole message again for each peer.
+
+    Params:
+        connections (List[Connection]): The connections to send the message to.
+        message (Message): The message to send.
+    """
+    data = pack_message(message)
+    for connection in connections:
+        threading.Thread(target=_send_data_with_connection, args=(connection, data,)).start()
+
+
 def _send_json_with_connection(connection: Connection, obj: dict):
+    _send_data_with_connection(connection, _pack_data(obj))
+
+
+def _send_data_with_connection(connection: Connection, data: bytes):
     with connection.get_socket_with_write_lock() as _socket:
-        _send_data(socket=_socket, obj=obj)
+        _send_data(socket=_socket, data=data)
 
 
-def _send_json_with_socket(socket: SocketType, obj: dict):
-    _send_data(socket=socket, obj=obj)
+def pack_message(message: Message) -> bytes:
+    """
+    Serialize and frame a message, so it can be sent several times without serializing it again.
 
+    Params:
+        message (Message): The message to pack.
 
-def _send_data(socket: SocketType, obj: dict):
-    try:
-        msg = json.dumps(obj).encode('utf-8')
-        msg_len = len(msg)
-        packed_len = struct.pack('!I', msg_len)
+    Returns:
+        bytes: The framed message.
+    """
+    return _pack_data(message.dict())
 
+
+def _pack_data(obj: dict) -> bytes:
+    """ Helper function to serialize an object with its length prefix. """
+    # The message is framed by its length, so the whitespace between tokens is not needed. Signatures are
+    # computed over the message fields, not over these bytes, so the compact form is understood by every peer.
+    msg = json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    msg_len = len(msg)
+    packed_len = struct.pack('!I', msg_len)
+    return packed_len + msg
+
+
+def _send_data(socket: SocketType, data: bytes):
+    try:
         _, ready_to_write, _ = select.select([], [socket], [], 5)
         if ready_to_write:
-            socket.sendall(packed_len + msg)
+            socket.sendall(data)
         else:
             raise TimeoutError("Socket send info time out")
     except (BrokenPipeError, TimeoutError):
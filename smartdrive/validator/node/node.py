@@ -37,7 +37,7 @@ from smartdrive.validator.node.connection.peer_manager import PeerManager
 from smartdrive.validator.node.event.event_pool import EventPool
 from smartdrive.validator.node.util.block_integrity import verify_event_signatures
 from smartdrive.validator.node.util.message import MessageCode, Message, MessageBody
-from smartdrive.validator.node.connection.utils.utils import send_message
+from smartdrive.validator.node.connection.utils.utils import broadcast_message
 
 
 class Node:
@@ -52,7 +52,7 @@ class Node:
 
         manager = multiprocessing.Manager()
         self._event_pool = EventPool(manager)
-        self.connection_pool = ConnectionPool(manager=manager, cache_size=PeerManager.MAX_N_CONNECTIONS)
+        self.connection_pool = ConnectionPool(cache_size=PeerManager.MAX_N_CONNECTIONS)
         self.initial_sync_completed = Value('b', False)
         self._database = Database()
 
@@ -86,23 +86,21 @@ class Node:
 
         message_event = MessageEvent.from_json(event.dict(), event.get_event_action())
 
-        connections = self.get_connections()
-        for index, connection in enumerate(connections):
-
-            body = MessageBody(
-                code=MessageCode.MESSAGE_CODE_EVENT,
-                data=message_event.dict()
-            )
+        # The message is the same for every peer, so it is signed and serialized only once.
+        body = MessageBody(
+            code=MessageCode.MESSAGE_CODE_EVENT,
+            data=message_event.dict()
+        )
 
-            body_sign = sign_data(body.dict(), self._keypair)
+        body_sign = sign_data(body.dict(), self._keypair)
 
-            message = Message(
-                body=body,
-                signature_hex=body_sign.hex(),
-                public_key_hex=self._keypair.public_key.hex()
-            )
+        message = Message(
+            body=body,
+            signature_hex=body_sign.hex(),
+            public_key_hex=self._keypair.public_key.hex()
+        )
 
-            send_message(connection, message)
+        broadcast_message(self.get_connections(), message)
 
     def consume_events(self, count: int) -> List[Union[StoreEvent, RemoveEvent]]:
         return self._event_pool.consume_events(count)
@@ -25,7 +25,6 @@ import os
 import argparse
 import time
 import asyncio
-import uuid
 
 from communex.module.module import Module
 from communex.compat.key import classic_load_key
@@ -38,11 +37,11 @@ from smartdrive.logging_config import logger
 from smartdrive.models.block import Block, MAX_EVENTS_PER_BLOCK, block_to_block_event
 from smartdrive.models.event import RemoveEvent, EventParams, RemoveInputParams, StoreRequestEvent
 from smartdrive.models.utils import compile_miners_info_and_chunks
-from smartdrive.utils import DEFAULT_VALIDATOR_PATH, periodic_version_check
+from smartdrive.utils import DEFAULT_VALIDATOR_PATH, periodic_version_check, generate_uuid
 from smartdrive.validator.api.utils import remove_chunk_request
 from smartdrive.validator.config import Config, config_manager
 from smartdrive.validator.database.database import Database
-from smartdrive.validator.node.connection.utils.utils import send_message
+from smartdrive.validator.node.connection.utils.utils import broadcast_message
 from smartdrive.validator.node.node import Node
 from smartdrive.validator.api.api import API
 from smartdrive.validator.evaluation.evaluation import score_miners, set_weights
@@ -55,7 +54,7 @@ from smartdrive.validator.node.util.utils import get_proposer_validator
 from smartdrive.validator.validation import validate
 from smartdrive.validator.utils import prepare_sync_blocks, get_stake_from_user, calculate_storage_capacity
 from smartdrive.sign import sign_data
-from smartdrive.commune.request import get_filtered_modules, get_modules
+from smartdrive.commune.request import get_filtered_modules, get_modules, periodic_modules_refresh
 
 
 def get_config() -> Config:
@@ -184,20 +183,23 @@ class Validator(Module):
                         signature_hex=body_sign.hex(),
                         public_key_hex=self._key.public_key.hex()
                     )
-                    for connection in self.node.get_connections():
-                        send_message(connection, block_message)
+                    broadcast_message(self.node.get_connections(), block_message)
 
-                    for event in block_events:
-                        if isinstance(event, RemoveEvent):
-                            # Only deletions are chosen, since as the block is processed before, the deletion is already marked for these events.
-                            chunks = self._database.get_chunks(file_uuid=event.event_params.file_uuid, only_not_removed=False)
-                            miners = await get_filtered_modules(config_manager.config.netuid, ModuleType.MINER, config_manager.config.testnet)
-                            miners_info_with_chunk = compile_miners_info_and_chunks(miners, chunks)
+                    # Only deletions are chosen, since as the block is processed before, the deletion is already marked for these events.
+                    remove_events = [event for event in block_events if isinstance(event, RemoveEvent)]
+                    miners = await get_filtered_modules(config_manager.config.netuid, ModuleType.MINER, config_manager.config.testnet) if remove_events else []
+                    remove_requests = []
+                    for event in remove_events:
+                        chunks = self._database.get_chunks(file_uuid=event.event_params.file_uuid, only_not_removed=False)
+                        miners_info_with_chunk = compile_miners_info_and_chunks(miners, chunks)
 
-                            for miner in miners_info_with_chunk:
-                                connection = ConnectionInfo(miner["connection"]["ip"], miner["connection"]["port"])
-                                miner_info = ModuleInfo(miner["uid"], miner["ss58_address"], connection)
-                                await remove_chunk_request(self._key, event.user_ss58_address, miner_info, miner["chunk_uuid"])
+                        for miner in miners_info_with_chunk:
+                            connection = ConnectionInfo(miner["connection"]["ip"], miner["connection"]["port"])
+                            miner_info = ModuleInfo(miner["uid"], miner["ss58_address"], connection)
+                            remove_requests.append(remove_chunk_request(self._key, event.user_ss58_address, miner_info, miner["chunk_uuid"]))
+
+                    # The removals are sent concurrently, so an offline miner does not delay the next block
+                    await asyncio.gather(*remove_requests, return_exceptions=True)
 
                 elapsed = time.monotonic() - start_step_time
                 sleep_time = max(0.0, self.BLOCK_INTERVAL_SECONDS - elapsed)
@@ -281,7 +283,7 @@ class Validator(Module):
                         signed_input_params = sign_data(input_params.dict(), self._key)
 
                         event = RemoveEvent(
-                            uuid=f"{int(time.time())}_{str(uuid.uuid4())}",
+                            uuid=generate_uuid(),
                             validator_ss58_address=Ss58Address(self._key.ss58_address),
                             event_params=event_params,
                             event_signed_params=signed_params.hex(),
@@ -316,6 +318,7 @@ if __name__ == "__main__":
 
             await asyncio.gather(
                 periodic_version_check(),
+                periodic_modules_refresh(config_manager.config.netuid, config_manager.config.testnet),
                 validator.api.run_server(),
                 validator.run_steps()
             )